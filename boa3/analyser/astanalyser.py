@@ -1,6 +1,8 @@
 import ast
+import sys
+import warnings
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 
 from boa3.exception.CompilerError import CompilerError
 from boa3.exception.CompilerWarning import CompilerWarning
@@ -9,6 +11,25 @@ from boa3.model.symbol import ISymbol
 from boa3.model.type.itype import IType
 from boa3.model.type.type import Type
 
+# types of the literal values, resolved without searching through all the types
+_LITERAL_TYPES: Dict[type, IType] = {
+    int: Type.int,
+    bool: Type.bool,
+    str: Type.str,
+    type(None): Type.none
+}
+
+# functions that get the value of the literal nodes
+if sys.version_info < (3, 8):
+    _LITERAL_NODE_VALUES: Dict[type, Callable[[ast.AST], Any]] = {
+        ast.Num: lambda node: node.n,
+        ast.NameConstant: lambda node: node.value
+    }
+else:
+    _LITERAL_NODE_VALUES: Dict[type, Callable[[ast.AST], Any]] = {
+        ast.Constant: lambda node: node.value
+    }
+
 
 class IAstAnalyser(ABC, ast.NodeVisitor):
     """
@@ -23,6 +44,48 @@ class IAstAnalyser(ABC, ast.NodeVisitor):
         self._tree: ast.AST = ast_tree
         self.symbols: Dict[str, ISymbol] = {}
 
+        self._visit_registry: Dict[type, Callable[[ast.AST], Any]] = {
+            node_type: visitor.__get__(self) for node_type, visitor in self._get_visitors().items()
+        }
+        self._type_dispatch: Dict[type, Callable[[Any], IType]] = {}
+
+    @classmethod
+    def _get_visitors(cls) -> Dict[type, Callable[..., Any]]:
+        """
+        Maps each Python ast node type to the visitor function of that node
+
+        The map is built once for each analyser class, walking through its mro so the visitors of the subclasses
+        override the visitors of their bases.
+
+        :return: a dictionary that maps each node type to its visitor function
+        """
+        visitors = cls.__dict__.get('_visitors')
+        if visitors is None:
+            visitors = {}
+            with warnings.catch_warnings():
+                # deprecated node classes, like ast.Num, still have visitors
+                warnings.simplefilter('ignore', DeprecationWarning)
+                for base in reversed(cls.__mro__):
+                    for name, visitor in vars(base).items():
+                        if name.startswith('visit_') and callable(visitor):
+                            node_type = getattr(ast, name[len('visit_'):], None)
+                            if isinstance(node_type, type):
+                                visitors[node_type] = visitor
+            cls._visitors = visitors
+        return visitors
+
+    def visit(self, node: ast.AST) -> Any:
+        """
+        Visits a node using the registered visitor of its type
+
+        :param node: the python ast node
+        :return: the result of the node visitor
+        """
+        visitor = self._visit_registry.get(type(node))
+        if visitor is None:
+            return self.generic_visit(node)
+        return visitor(node)
+
     @property
     def has_errors(self) -> bool:
         return len(self.errors) > 0
@@ -40,23 +103,69 @@ class IAstAnalyser(ABC, ast.NodeVisitor):
         :param value: value to get the type
         :return: Returns the :class:`IType` of the the type of the value. `Type.none` by default.
         """
-        # visits if it is a node
-        if isinstance(value, ast.AST):
-            fun_rtype_id: str = ast.NodeVisitor.visit(self, value)
-            if isinstance(fun_rtype_id, ast.Name):
-                fun_rtype_id = fun_rtype_id.id
-
-            if isinstance(fun_rtype_id, str):
-                value = self.get_symbol(fun_rtype_id)
-            else:
-                value = fun_rtype_id
-
-        if isinstance(value, IType):
-            return value
-        elif isinstance(value, IExpression):
-            return value.type
+        value_type = type(value)
+        handler = self._type_dispatch.get(value_type)
+        if handler is None:
+            handler = self.__get_type_handler(value_type)
+            self._type_dispatch[value_type] = handler
+        return handler(value)
+
+    def __get_type_handler(self, value_type: type) -> Callable[[Any], IType]:
+        """
+        Gets the function that resolves the type of the values of the given class
+
+        :param value_type: the class of the value
+        :return: a function that returns the :class:`IType` of a value
+        """
+        if value_type in _LITERAL_NODE_VALUES:
+            return self.__get_literal_node_type
+        elif issubclass(value_type, ast.AST):
+            return self.__get_node_type
+        elif value_type in _LITERAL_TYPES:
+            literal_type = _LITERAL_TYPES[value_type]
+            return lambda value: literal_type
+        elif issubclass(value_type, IType):
+            return lambda value: value
+        elif issubclass(value_type, IExpression):
+            return lambda value: value.type
         else:
+            return Type.get_type
+
+    def __get_literal_node_type(self, node: ast.AST) -> IType:
+        """
+        Returns the type of a literal node without visiting it if possible
+
+        :param node: the python ast literal node
+        :return: Returns the :class:`IType` of the the type of the literal.
+        """
+        value = _LITERAL_NODE_VALUES[type(node)](node)
+        value_type = type(value)
+        if value_type is not str and value_type in _LITERAL_TYPES:
+            return _LITERAL_TYPES[value_type]
+
+        # string literals are resolved as symbol ids and the other literals are validated by the visitors
+        return self.__get_node_type(node)
+
+    def __get_node_type(self, node: ast.AST) -> IType:
+        """
+        Visits the node and returns the type of its result
+
+        :param node: the python ast node
+        :return: Returns the :class:`IType` of the the type of the node value. `Type.none` by default.
+        """
+        fun_rtype_id: str = self.visit(node)
+        if isinstance(fun_rtype_id, ast.Name):
+            fun_rtype_id = fun_rtype_id.id
+
+        if isinstance(fun_rtype_id, str):
+            value = self.get_symbol(fun_rtype_id)
+        else:
+            value = fun_rtype_id
+
+        if isinstance(value, ast.AST):
+            # the node is not visited again
             return Type.get_type(value)
+        return self.get_type(value)
 
     @abstractmethod
     def get_symbol(self, symbol_id: str) -> Optional[ISymbol]:
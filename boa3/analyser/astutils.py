@@ -0,0 +1,17 @@
+import ast
+import sys
+
+
+def get_subscript_index(subscript: ast.Subscript) -> ast.AST:
+    """
+    Gets the index node of a subscript
+
+    Before Python 3.9, simple indexes are wrapped in an ast.Index node.
+
+    :param subscript: the python ast subscript node
+    :return: the node of the subscript index
+    """
+    index = subscript.slice
+    if sys.version_info < (3, 9) and isinstance(index, ast.Index):
+        return index.value
+    return index
@@ -2,6 +2,7 @@ import ast
 from typing import Dict, Tuple, Any, Optional
 
 from boa3.analyser.astanalyser import IAstAnalyser
+from boa3.analyser.astutils import get_subscript_index
 from boa3.exception import CompilerError
 from boa3.exception.CompilerError import CompilerError as Error
 from boa3.model.method import Method
@@ -13,7 +14,7 @@ from boa3.model.type.type import Type
 from boa3.model.variable import Variable
 
 
-class ModuleAnalyser(IAstAnalyser, ast.NodeVisitor):
+class ModuleAnalyser(IAstAnalyser):
     """
     This class is responsible for mapping the locals of the functions and modules
 
@@ -256,7 +257,7 @@ class ModuleAnalyser(IAstAnalyser, ast.NodeVisitor):
             subscript.value.id = value.lower() if symbol is not None else subscript.value
 
         if isinstance(symbol, SequenceType):
-            values_type: IType = self.get_values_type(subscript.slice.value)
+            values_type: IType = self.get_values_type(get_subscript_index(subscript))
             return symbol.build_sequence(values_type)
 
         return value
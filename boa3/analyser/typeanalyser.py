@@ -1,7 +1,9 @@
 import ast
-from typing import List, Dict, Optional, Any, Tuple
+from collections import ChainMap, deque
+from typing import List, Dict, Optional, Any, Tuple, Deque, Union, Callable, FrozenSet
 
 from boa3.analyser.astanalyser import IAstAnalyser
+from boa3.analyser.astutils import get_subscript_index
 from boa3.exception import CompilerError
 from boa3.exception.CompilerError import CompilerError as Error
 from boa3.model.method import Method
@@ -15,8 +17,36 @@ from boa3.model.symbol import ISymbol
 from boa3.model.type.sequencetype import SequenceType
 from boa3.model.type.type import Type, IType
 
-
-class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
+# bindings of the operations lookups used when validating the operands types
+_bin_validate = BinaryOp.validate_type
+_bin_by_op = BinaryOp.get_operation_by_operator
+_un_validate = UnaryOp.validate_type
+_un_by_op = UnaryOp.get_operation_by_operator
+
+# maps each operator from Python ast to its equivalent Boa operator
+_OPERATOR_MAP: Dict[type, Operator] = {
+    ast.Add: Operator.Plus,
+    ast.Sub: Operator.Minus,
+    ast.Mult: Operator.Mult,
+    ast.FloorDiv: Operator.IntDiv,
+    ast.Mod: Operator.Mod,
+    ast.UAdd: Operator.Plus,
+    ast.USub: Operator.Minus,
+    ast.Eq: Operator.Eq,
+    ast.NotEq: Operator.NotEq,
+    ast.Lt: Operator.Lt,
+    ast.LtE: Operator.LtE,
+    ast.Gt: Operator.Gt,
+    ast.GtE: Operator.GtE,
+    ast.Is: Operator.Is,
+    ast.IsNot: Operator.IsNot,
+    ast.And: Operator.And,
+    ast.Or: Operator.Or,
+    ast.Not: Operator.Not
+}
+
+
+class TypeAnalyser(IAstAnalyser):
     """
     This class is responsible for the type checking of the code
 
@@ -26,7 +56,6 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
     :ivar type_errors: a list with the found type errors. Empty by default.
     :ivar modules: a list with the analysed modules. Empty by default.
     :ivar symbols: a dictionary that maps the global symbols.
-    :cvar __operators: a dictionary that maps each operator from Python ast to its equivalent Boa operator.
     """
 
     def __init__(self, ast_tree: ast.AST, symbol_table: Dict[str, ISymbol]):
@@ -34,36 +63,62 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
         self.type_errors: List[Exception] = []
         self.modules: Dict[str, Module] = {}
         self.symbols: Dict[str, ISymbol] = symbol_table
+        # the lookup order is: local scope, modules scope and then global scope
+        self._scope_chain: ChainMap = ChainMap(self.modules, self.symbols)
+        # identifiers of the types that can be used in type hints
+        self._type_name_set: FrozenSet[str] = frozenset(
+            symbol_id for symbol_id, symbol in symbol_table.items() if isinstance(symbol, IType)
+        )
 
         self.__current_method: Method = None
+        self.__current_method_name: Optional[str] = None
+
+        # memoized operations and the expected operand types if the operation is not valid
+        self._bin_op_cache: Dict[Tuple[Operator, IType, IType], Tuple[Optional[BinaryOperation], str]] = {}
+        self._un_op_cache: Dict[Tuple[Operator, IType], Tuple[Optional[UnaryOperation], str]] = {}
 
-        self.visit(self._tree)
-
-    __operators = {
-        ast.Add: Operator.Plus,
-        ast.Sub: Operator.Minus,
-        ast.Mult: Operator.Mult,
-        ast.FloorDiv: Operator.IntDiv,
-        ast.Mod: Operator.Mod,
-        ast.UAdd: Operator.Plus,
-        ast.USub: Operator.Minus,
-        ast.Eq: Operator.Eq,
-        ast.NotEq: Operator.NotEq,
-        ast.Lt: Operator.Lt,
-        ast.LtE: Operator.LtE,
-        ast.Gt: Operator.Gt,
-        ast.GtE: Operator.GtE,
-        ast.Is: Operator.Is,
-        ast.IsNot: Operator.IsNot,
-        ast.And: Operator.And,
-        ast.Or: Operator.Or,
-        ast.Not: Operator.Not
-    }
+        self._stack: Deque[Union[ast.AST, Callable[[], None]]] = deque()
+        self.__traverse(self._tree)
 
     def _log_error(self, error: Error):
         self.errors.append(error)
         raise error
 
+    def __traverse(self, root: ast.AST):
+        """
+        Walks through the statements of the tree using a stack instead of recursion
+
+        The statement list visitors push their statements into the stack. Callables in the stack are executed when
+        they are reached, and are used to close the scopes opened by the visitors.
+
+        :param root: the root node of the python ast
+        """
+        stack = self._stack
+        stack.append(root)
+        visit = self.visit
+        while stack:
+            item = stack.pop()
+            if isinstance(item, ast.AST):
+                visit(item)
+            else:
+                item()
+
+    def _push_body(self, body: List[ast.AST]):
+        """
+        Pushes a list of statements into the stack, so they are visited in the same order of the list
+
+        :param body: the list of statements
+        """
+        self._stack.extend(reversed(body))
+
+    def __end_method(self):
+        """
+        Leaves the scope of the current method
+        """
+        self.__current_method = None
+        self.__current_method_name = None
+        self._scope_chain = self._scope_chain.parents
+
     @property
     def __current_method_id(self) -> str:
         """
@@ -72,9 +127,7 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
         :return: The name identifier of the method. If the current method is None, returns None.
         :rtype: str or None
         """
-        if self.__current_method in self.symbols.values():
-            index = list(self.symbols.values()).index(self.__current_method)
-            return list(self.symbols.keys())[index]
+        return self.__current_method_name
 
     @property
     def __modules_symbols(self) -> Dict[str, ISymbol]:
@@ -89,18 +142,7 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
         return symbols
 
     def get_symbol(self, symbol_id: str) -> Optional[ISymbol]:
-        if self.__current_method is not None and symbol_id in self.__current_method.symbols:
-            # the symbol exists in the local scope
-            return self.__current_method.symbols[symbol_id]
-        elif symbol_id in self.modules:
-            # the symbol exists in the modules scope
-            return self.modules[symbol_id]
-        elif symbol_id in self.symbols:
-            # the symbol exists in the global scope
-            return self.symbols[symbol_id]
-        else:
-            # the symbol was not found
-            return None
+        return self._scope_chain.get(symbol_id)
 
     def visit_Module(self, module: ast.Module):
         """
@@ -110,8 +152,7 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
 
         :param module: the python ast module node
         """
-        for stmt in module.body:
-            self.visit(stmt)
+        self._push_body(module.body)
 
     def visit_FunctionDef(self, function: ast.FunctionDef):
         """
@@ -124,10 +165,12 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
         self.visit(function.args)
         method = self.symbols[function.name]
         self.__current_method = method
+        self.__current_method_name = function.name
+        self._scope_chain = self._scope_chain.new_child(method.symbols)
 
-        for stmt in function.body:
-            self.visit(stmt)
-        self.__current_method = None
+        # the scope is closed only after all the statements in the body are checked
+        self._stack.append(self.__end_method)
+        self._push_body(function.body)
 
     def visit_arguments(self, arguments: ast.arguments):
         """
@@ -193,14 +236,9 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
 
         :param assign: the python ast variable assignment node
         """
-        # multiple assignments
-        if len(assign.targets) > 1:
-            self._log_error(
-                CompilerError.NotSupportedOperation(assign.lineno, assign.col_offset, 'Multiple variable assignments')
-            )
-
-        # multiple assignments with tuples
-        if isinstance(assign.targets[0], ast.Tuple):
+        targets = assign.targets
+        # multiple assignments, with multiple targets or with tuples
+        if len(targets) > 1 or targets[0].__class__ is ast.Tuple:
             self._log_error(
                 CompilerError.NotSupportedOperation(assign.lineno, assign.col_offset, 'Multiple variable assignments')
             )
@@ -215,8 +253,17 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
         :param subscript: the python ast subscript node
         :return: the type of the accessed value if it is valid. Type.none otherwise.
         """
-        value = self.visit(subscript.value)
-        index = self.visit(subscript.slice)
+        value_node = subscript.value
+        index_node = get_subscript_index(subscript)
+        type_names = self._type_name_set
+        is_type_value = isinstance(value_node, ast.Name) and value_node.id in type_names
+        if is_type_value and isinstance(index_node, ast.Name) and index_node.id in type_names:
+            # type hints don't need to be visited
+            value = self.get_symbol(value_node.id)
+            index = self.get_symbol(index_node.id)
+        else:
+            value = self.visit(value_node)
+            index = self.visit(index_node)
 
         if isinstance(value, ast.Name):
             value = self.get_symbol(value.id)
@@ -267,10 +314,7 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
             )
 
         # continue to walk through the tree
-        for stmt in while_node.body:
-            self.visit(stmt)
-        for stmt in while_node.orelse:
-            self.visit(stmt)
+        self._push_body(while_node.body + while_node.orelse)
 
     def visit_If(self, if_node: ast.If):
         """
@@ -280,15 +324,20 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
         """
         self.validate_if(if_node)
         # continue to walk through the tree
-        for stmt in if_node.body:
-            self.visit(stmt)
+        self._stack.append(lambda: self.__visit_orelse(if_node))
+        self._push_body(if_node.body)
+
+    def __visit_orelse(self, if_node: ast.If):
+        """
+        Pushes the else statements of an if node into the stack
 
+        :param if_node: the python ast if statement node
+        """
         if len(if_node.orelse) == 1 and isinstance(if_node.orelse[0], ast.If):
             # TODO: remove when implement elif statement
             raise NotImplementedError
 
-        for stmt in if_node.orelse:
-            self.visit(stmt)
+        self._push_body(if_node.orelse)
 
     def visit_IfExp(self, if_node: ast.IfExp):
         """
@@ -371,16 +420,35 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
         """
         l_type: IType = self.get_type(left)
         r_type: IType = self.get_type(right)
+        return self._get_bin_op_by_types(operator, r_type, l_type)
 
-        actual_types: str = "%s', '%s" % (l_type.identifier, r_type.identifier)
-        operation: BinaryOperation = BinaryOp.validate_type(operator, l_type, r_type)
+    def _get_bin_op_by_types(self, operator: Operator, r_type: IType, l_type: IType) -> BinaryOperation:
+        """
+        Returns the binary operation specified by the operator and the already resolved types of the operands
+
+        :param operator: the operator
+        :param r_type: right operand type
+        :param l_type: left operand type
+
+        :return: Returns the corresponding :class:`BinaryOperation` if the types are valid.
+        :raise MismatchedTypes: raised if the types aren't valid for the operator
+        """
+        key = (operator, l_type, r_type)
+        cached = self._bin_op_cache.get(key)
+        if cached is None:
+            operation: BinaryOperation = _bin_validate(operator, l_type, r_type)
+            expected_types: str = None
+            if operation is None:
+                expected_op: BinaryOperation = _bin_by_op(operator)
+                expected_types = "%s', '%s" % (expected_op.left_type.identifier, expected_op.right_type.identifier)
+            cached = self._bin_op_cache[key] = (operation, expected_types)
+        operation, expected_types = cached
 
         if operation is not None:
             return operation
-        else:
-            expected_op: BinaryOperation = BinaryOp.get_operation_by_operator(operator)
-            expected_types: str = "%s', '%s" % (expected_op.left_type.identifier, expected_op.right_type.identifier)
-            raise CompilerError.MismatchedTypes(0, 0, expected_types, actual_types)
+
+        actual_types: str = "%s', '%s" % (l_type.identifier, r_type.identifier)
+        raise CompilerError.MismatchedTypes(0, 0, expected_types, actual_types)
 
     def visit_UnaryOp(self, un_op: ast.UnaryOp) -> Optional[IType]:
         """
@@ -434,15 +502,22 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
         """
         op_type: IType = self.get_type(operand)
 
-        actual_type: str = op_type.identifier
-        operation: UnaryOperation = UnaryOp.validate_type(operator, op_type)
+        key = (operator, op_type)
+        cached = self._un_op_cache.get(key)
+        if cached is None:
+            operation: UnaryOperation = _un_validate(operator, op_type)
+            expected_type: str = None
+            if operation is None:
+                expected_op: UnaryOperation = _un_by_op(operator)
+                expected_type = expected_op.operand_type.identifier
+            cached = self._un_op_cache[key] = (operation, expected_type)
+        operation, expected_type = cached
 
         if operation is not None:
             return operation
-        else:
-            expected_op: UnaryOperation = UnaryOp.get_operation_by_operator(operator)
-            expected_type: str = expected_op.operand_type.identifier
-            raise CompilerError.MismatchedTypes(0, 0, expected_type, actual_type)
+
+        actual_type: str = op_type.identifier
+        raise CompilerError.MismatchedTypes(0, 0, expected_type, actual_type)
 
     def visit_Compare(self, compare: ast.Compare) -> Optional[IType]:
         """
@@ -466,12 +541,19 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
 
         line = compare.lineno
         col = compare.col_offset
+        # local bindings of the methods used in the loop
+        get_operator = self.get_operator
+        get_type = self.get_type
+        visit = self.visit
+        get_bin_op_by_types = self._get_bin_op_by_types
+        comparators = compare.comparators
         try:
             return_type = None
-            l_operand = self.visit(compare.left)
+            l_type: IType = get_type(visit(compare.left))
             for index, op in enumerate(compare.ops):
-                operator: Operator = self.get_operator(op)
-                r_operand = self.visit(compare.comparators[index])
+                operator: Operator = get_operator(op)
+                comparator = comparators[index]
+                r_type: IType = get_type(visit(comparator))
 
                 if not isinstance(operator, Operator):
                     # the operator is invalid or it was not implemented yet
@@ -479,7 +561,7 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
                         CompilerError.UnresolvedReference(line, col, type(op).__name__)
                     )
 
-                operation: BinaryOperation = self.get_bin_op(operator, r_operand, l_operand)
+                operation: BinaryOperation = get_bin_op_by_types(operator, r_type, l_type)
                 if operation is None:
                     self._log_error(
                         CompilerError.NotSupportedOperation(line, col, operator)
@@ -493,9 +575,9 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
                     compare.ops[index] = operation
                     return_type = operation.result
 
-                line = compare.comparators[index].lineno
-                col = compare.comparators[index].col_offset
-                l_operand = r_operand
+                line = comparator.lineno
+                col = comparator.col_offset
+                l_type = r_type
 
             return return_type
         except CompilerError.MismatchedTypes as raised_error:
@@ -528,11 +610,16 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
                     CompilerError.UnresolvedReference(lineno, col_offset, type(operator).__name__)
                 )
 
-            l_operand = self.visit(bool_op.values[0])
+            # local bindings of the methods used in the loop
+            get_type = self.get_type
+            visit = self.visit
+            get_bin_op_by_types = self._get_bin_op_by_types
+
+            l_type: IType = get_type(visit(bool_op.values[0]))
             for index, operand in enumerate(bool_op.values[1:]):
-                r_operand = self.visit(operand)
+                r_type: IType = get_type(visit(operand))
 
-                operation: BinaryOperation = self.get_bin_op(operator, r_operand, l_operand)
+                operation: BinaryOperation = get_bin_op_by_types(operator, r_type, l_type)
                 if operation is None:
                     self._log_error(
                         CompilerError.NotSupportedOperation(lineno, col_offset, operator)
@@ -543,7 +630,7 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
 
                 lineno = operand.lineno
                 col_offset = operand.col_offset
-                l_operand = r_operand
+                l_type = r_type
 
             bool_op.op = bool_operation
             return return_type
@@ -567,11 +654,7 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
             # the node has already been visited
             return node
 
-        node_type = type(node)
-        if node_type in self.__operators:
-            return self.__operators[node_type]
-        else:
-            return None
+        return _OPERATOR_MAP.get(type(node))
 
     def visit_Num(self, num: ast.Num) -> int:
         """
@@ -603,7 +686,7 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
         :param tup_node: the python ast string node
         :return: the value of the tuple
         """
-        return tuple(value for value in tup_node.elts)
+        return tuple(tup_node.elts)
 
     def visit_NameConstant(self, constant: ast.NameConstant) -> Any:
         """
@@ -623,15 +706,6 @@ class TypeAnalyser(IAstAnalyser, ast.NodeVisitor):
         """
         return name
 
-    def visit_Index(self, index: ast.Index) -> Any:
-        """
-        Visitor of an index node
-
-        :param index:
-        :return: the object with the index value information
-        """
-        return self.visit(index.value)
-
     def visit_Break(self, break_node: ast.Break):
         """
         :param break_node: the python ast break statement node
@@ -359,7 +359,7 @@ class CodeGenerator:
         op_info = OpcodeInfo.get_info(opcode)
 
         if op_info.data_len > 0:
-            self.__insert1(op_info, Integer(index).to_byte_array())
+            self.__insert1(op_info, index.to_bytes(op_info.data_len, sys.byteorder))
         else:
             self.__insert1(op_info)
 
@@ -385,7 +385,7 @@ class CodeGenerator:
         op_info = OpcodeInfo.get_info(opcode)
 
         if op_info.data_len > 0:
-            self.__insert1(op_info, Integer(index).to_byte_array())
+            self.__insert1(op_info, index.to_bytes(op_info.data_len, sys.byteorder))
         else:
             self.__insert1(op_info)
 
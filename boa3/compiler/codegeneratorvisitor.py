@@ -1,6 +1,7 @@
 import ast
 from typing import Dict, Tuple
 
+from boa3.analyser.astutils import get_subscript_index
 from boa3.compiler.codegenerator import CodeGenerator
 from boa3.model.method import Method
 from boa3.model.operation.binary.binaryoperation import BinaryOperation
@@ -148,15 +149,17 @@ class VisitorCodeGenerator(ast.NodeVisitor):
 
         :param subscript: the python ast subscript node
         """
+        index = get_subscript_index(subscript)
+
         if isinstance(subscript.ctx, ast.Load):
             # get item
             self.visit_to_generate(subscript.value)
-            self.visit_to_generate(subscript.slice.value)
+            self.visit_to_generate(index)
             self.generator.convert_get_array_item()
         else:
             # set item
             var_id = self.visit(subscript.value)
-            return var_id, subscript.slice.value
+            return var_id, index
 
     def visit_BinOp(self, bin_op: ast.BinOp):
         """
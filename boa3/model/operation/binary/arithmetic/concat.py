@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import FrozenSet, Optional
 
 from boa3.model.operation.binary.binaryoperation import BinaryOperation
 from boa3.model.operation.operator import Operator
@@ -15,7 +15,7 @@ class Concat(BinaryOperation):
     :ivar right: the left operand type. Inherited from :class:`BinaryOperation`
     :ivar result: the result type of the operation.  Inherited from :class:`IOperation`
     """
-    _valid_types: List[IType] = [Type.str]
+    _valid_types: FrozenSet[IType] = frozenset({Type.str})
 
     def __init__(self, left: IType = Type.str, right: IType = Type.str):
         self.operator: Operator = Operator.Plus
@@ -24,13 +24,13 @@ class Concat(BinaryOperation):
     def validate_type(self, *types: IType) -> bool:
         if len(types) != self._get_number_of_operands:
             return False
-        left: IType = types[0]
-        right: IType = types[1]
+        left, right = types
 
-        return left == right and left in self._valid_types
+        # the valid types are singletons, so they can be compared by identity
+        return left is right and left in self._valid_types
 
     def _get_result(self, left: IType, right: IType) -> IType:
-        if self.validate_type(left, right):
+        if left is right and left in self._valid_types:
             return left
         else:
             return Type.none
@@ -2,4 +2,4 @@ from abc import ABC
 
 
 class ISymbol(ABC):
-    pass
+    __slots__ = ()
@@ -1,21 +1,21 @@
 from typing import Any
 
-from boa3.model.type.itype import IType
+from boa3.model.type.itype import IType, register_type
 from boa3.neo.vm.type.AbiType import AbiType
 
 
+@register_type
 class BoolType(IType):
     """
     A class used to represent Python bool type
     """
+    __slots__ = ()
+    abi_type: AbiType = AbiType.Boolean
+
     def __init__(self):
         identifier = 'bool'
         super().__init__(identifier)
 
-    @property
-    def abi_type(self) -> AbiType:
-        return AbiType.Boolean
-
     @classmethod
     def build(cls, value: Any):
         if cls.is_type_of(value):
@@ -1,27 +1,33 @@
-from typing import Any
+from typing import Any, Optional
 
-from boa3.model.type.itype import IType
+from boa3.model.type.itype import IType, register_type
 from boa3.neo.vm.type.AbiType import AbiType
 
+_int = int
 
+
+@register_type
 class IntType(IType):
     """
     A class used to represent Python int type
     """
+    __slots__ = ()
+    abi_type: AbiType = AbiType.Integer
+    _cached_int: Optional[IType] = None
+
     def __init__(self):
         identifier = 'int'
         super().__init__(identifier)
 
-    @property
-    def abi_type(self) -> AbiType:
-        return AbiType.Integer
-
     @classmethod
     def build(cls, value: Any):
         if cls.is_type_of(value):
-            from boa3.model.type.type import Type
-            return Type.int
+            if cls._cached_int is None:
+                # Type can't be imported at module level because of circular imports
+                from boa3.model.type.type import Type
+                cls._cached_int = Type.int
+            return cls._cached_int
 
     @classmethod
     def is_type_of(cls, value: Any):
-        return type(value) == int
+        return value.__class__ is _int
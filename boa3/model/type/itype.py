@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Any
+from typing import Any, Callable, List, Tuple, Type
 
 from boa3.model.symbol import ISymbol
 from boa3.neo.vm.type.AbiType import AbiType
@@ -10,18 +10,14 @@ class IType(ISymbol):
     An interface used to represent types
 
     :ivar identifier: the name identifier of the type
+    :cvar abi_type: the type representation for the abi. Any by default.
     """
-    def __init__(self, identifier: str):
-        self.identifier: str = identifier
-
-    @property
-    def abi_type(self) -> AbiType:
-        """
-        Get the type representation for the abi
+    __slots__ = ('identifier',)
+    identifier: str
+    abi_type: AbiType = AbiType.Any
 
-        :return: the representation for the abi. Any by default.
-        """
-        return AbiType.Any
+    def __init__(self, identifier: str):
+        self.identifier = identifier
 
     @classmethod
     @abstractmethod
@@ -46,3 +42,17 @@ class IType(ISymbol):
         :rtype: IType or None
         """
         pass
+
+
+_TYPE_REGISTRY: List[Tuple[Callable[[Any], bool], Type[IType]]] = []
+
+
+def register_type(cls: Type[IType]) -> Type[IType]:
+    """
+    Registers a concrete type to be used when inferring the type of a value
+
+    :param cls: the type class to be registered
+    :return: the same type class
+    """
+    _TYPE_REGISTRY.append((cls.is_type_of, cls))
+    return cls
@@ -8,8 +8,11 @@ class SequenceType(IType, ABC):
     """
     An interface used to represent Python sequence type
     """
+    __slots__ = ('value_type',)
+    value_type: IType
+
     def __init__(self, identifier: str, values_type: List[IType]):
-        self.value_type: IType = self.__initialize_sequence_type(values_type)
+        self.value_type = self.__initialize_sequence_type(values_type)
         super().__init__(identifier)
 
     @classmethod
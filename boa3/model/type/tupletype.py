@@ -1,24 +1,23 @@
 from typing import Any, List
 
-from boa3.model.type.itype import IType
+from boa3.model.type.itype import IType, register_type
 from boa3.model.type.sequencetype import SequenceType
 from boa3.neo.vm.type.AbiType import AbiType
 
 
+@register_type
 class TupleType(SequenceType):
     """
     A class used to represent Python tuple type
     """
+    __slots__ = ()
+    abi_type: AbiType = AbiType.Array  # TODO: change when 'bytes' is implemented
 
     def __init__(self, values_type: List[IType] = None):
         identifier = 'tuple'
         values_type = self.filter_types(values_type)
         super().__init__(identifier, values_type)
 
-    @property
-    def abi_type(self) -> AbiType:
-        return AbiType.Array  # TODO: change when 'bytes' is implemented
-
     def is_valid_key(self, value_type: IType) -> bool:
         return value_type == self.valid_key
 
@@ -2,7 +2,7 @@ from typing import Dict, Any
 
 from boa3.model.type.booltype import BoolType
 from boa3.model.type.inttype import IntType
-from boa3.model.type.itype import IType
+from boa3.model.type.itype import IType, _TYPE_REGISTRY
 from boa3.model.type.nonetype import NoneType
 from boa3.model.type.strtype import StrType
 from boa3.model.type.tupletype import TupleType
@@ -26,9 +26,9 @@ class Type:
         :return: Returns the type of the value. `Type.none` by default.
         """
         val: IType = None
-        for type in vars(cls).values():
-            if isinstance(type, IType) and type.is_type_of(value):
-                val = type.build(value)
+        for is_type_of, type_class in _TYPE_REGISTRY:
+            if is_type_of(value):
+                val = type_class.build(value)
                 break
 
         if val is not None:
@@ -1,9 +1,8 @@
 from enum import Enum
-from typing import Dict
-
-from boa3.neo.vm.type.Integer import Integer
+from typing import Tuple
 
 
+# the members are singletons: compare opcodes with `is` instead of `==`, which falls back to comparing the bytes
 class Opcode(bytes, Enum):
 
     # region Constants
@@ -36,8 +35,7 @@ class Opcode(bytes, Enum):
         :rtype: Opcode or None
         """
         if -1 <= integer <= 16:
-            opcode_value: int = Integer.from_bytes(Opcode.PUSH0) + integer
-            return Opcode(Integer(opcode_value).to_byte_array())
+            return _PUSH_LITERAL[integer + 1]
         else:
             return None
 
@@ -82,45 +80,36 @@ class Opcode(bytes, Enum):
 
     # region Flow control
 
-    def get_large_jump(self):
+    @property
+    def is_small_jump(self) -> bool:
         """
-        Gets the large jump opcode to the standard jump
+        Verifies if the opcode is a jump with a 1-byte offset
 
-        :return: the respective opcode
-        :rtype: Opcode or None
+        :return: whether the opcode is a small jump
         """
-        if self in self.__larger_jump:
-            return self.__larger_jump[self]
-        else:
-            return None
+        # small jumps are the even opcodes from JMP (0x22) to JMPLE (0x32)
+        value = self[0]
+        return 0x22 <= value <= 0x32 and not value & 1
 
     @property
-    def __larger_jump(self) -> Dict[bytes, bytes]:
+    def is_large_jump(self) -> bool:
         """
-        A map of each jump with its larger equivalent
+        Verifies if the opcode is a jump with a 4-bytes offset
 
-        :return: a dictionary that maps each jump opcode to its larger equivalent.
+        :return: whether the opcode is a large jump
         """
-        return {
-            self.JMP: self.JMP_L,
-            self.JMP_L: self.JMP_L,
-            self.JMPIF: self.JMPIF_L,
-            self.JMPIF_L: self.JMPIF_L,
-            self.JMPIFNOT: self.JMPIFNOT_L,
-            self.JMPIFNOT_L: self.JMPIFNOT_L,
-            self.JMPEQ: self.JMPEQ_L,
-            self.JMPEQ_L: self.JMPEQ_L,
-            self.JMPNE: self.JMPNE_L,
-            self.JMPNE_L: self.JMPNE_L,
-            self.JMPGT: self.JMPGT_L,
-            self.JMPGT_L: self.JMPGT_L,
-            self.JMPGE: self.JMPGE_L,
-            self.JMPGE_L: self.JMPGE_L,
-            self.JMPLT: self.JMPLT_L,
-            self.JMPLT_L: self.JMPLT_L,
-            self.JMPLE: self.JMPLE_L,
-            self.JMPLE_L: self.JMPLE_L
-        }
+        # large jumps are the odd opcodes from JMP_L (0x23) to JMPLE_L (0x33)
+        value = self[0]
+        return 0x23 <= value <= 0x33 and bool(value & 1)
+
+    def get_large_jump(self):
+        """
+        Gets the large jump opcode to the standard jump
+
+        :return: the respective opcode
+        :rtype: Opcode or None
+        """
+        return _LARGE_JUMP.get(self)
 
     # The NOP operation does nothing. It is intended to fill in space if opcodes are patched.
     NOP = b'\x21'
@@ -275,21 +264,14 @@ class Opcode(bytes, Enum):
         if not local:
             is_arg = False
 
-        if 0 <= index <= 6:
-            if is_arg:
-                opcode_value: int = Integer.from_bytes(Opcode.STARG0) + index
-            elif local:
-                opcode_value: int = Integer.from_bytes(Opcode.STLOC0) + index
-            else:
-                opcode_value: int = Integer.from_bytes(Opcode.STSFLD0) + index
-            return Opcode(Integer(opcode_value).to_byte_array())
+        if is_arg:
+            opcodes, large_opcode = _STARG, Opcode.STARG
+        elif local:
+            opcodes, large_opcode = _STLOC, Opcode.STLOC
         else:
-            if is_arg:
-                return Opcode.STARG
-            elif local:
-                return Opcode.STLOC
-            else:
-                return Opcode.STSFLD
+            opcodes, large_opcode = _STSFLD, Opcode.STSFLD
+
+        return opcodes[index] if 0 <= index <= 6 else large_opcode
 
     @staticmethod
     def get_load(index: int, local: bool, is_arg: bool = False):
@@ -305,21 +287,14 @@ class Opcode(bytes, Enum):
         if not local:
             is_arg = False
 
-        if 0 <= index <= 6:
-            if is_arg:
-                opcode_value: int = Integer.from_bytes(Opcode.LDARG0) + index
-            elif local:
-                opcode_value: int = Integer.from_bytes(Opcode.LDLOC0) + index
-            else:
-                opcode_value: int = Integer.from_bytes(Opcode.LDSFLD0) + index
-            return Opcode(Integer(opcode_value).to_byte_array())
+        if is_arg:
+            opcodes, large_opcode = _LDARG, Opcode.LDARG
+        elif local:
+            opcodes, large_opcode = _LDLOC, Opcode.LDLOC
         else:
-            if is_arg:
-                return Opcode.LDARG
-            elif local:
-                return Opcode.LDLOC
-            else:
-                return Opcode.LDSFLD
+            opcodes, large_opcode = _LDSFLD, Opcode.LDSFLD
+
+        return opcodes[index] if 0 <= index <= 6 else large_opcode
 
     # Loads the static field at index 0 onto the evaluation stack.
     LDSFLD0 = b'\x58'
@@ -428,8 +403,8 @@ class Opcode(bytes, Enum):
 
     # region Splice
 
-    NEWBUFFER = b'\x88',
-    MEMCPY = b'\x89',
+    NEWBUFFER = b'\x88'
+    MEMCPY = b'\x89'
     # Concatenates two strings.
     CAT = b'\x8B'
     # Returns a section of a string.
@@ -571,3 +546,33 @@ class Opcode(bytes, Enum):
     CONVERT = b'\xDB'
 
     # endregion
+
+
+# maps the byte value of each opcode to its member, avoiding the Enum lookup by value
+_BY_VALUE = {op[0]: op for op in Opcode}
+
+# the push opcodes of the integers from -1 to 16
+_PUSH_LITERAL = (Opcode.PUSHM1,) + tuple(_BY_VALUE[0x10 + i] for i in range(17))
+
+# maps each jump opcode to its version with a 4-bytes offset
+# each large jump is placed right after its respective small jump
+_LARGE_JUMP = {op: _BY_VALUE[op[0] | 1] for op in Opcode if op.is_small_jump or op.is_large_jump}
+
+
+def _slot_opcodes(name: str) -> Tuple[Opcode, ...]:
+    """
+    Gets the opcodes of the indexes from 0 to 6 of a slot operation
+
+    :param name: the name of the slot operation, without the index
+    :return: a tuple with the opcodes ordered by index
+    """
+    return tuple(Opcode[name + str(index)] for index in range(7))
+
+
+# the store and load opcodes of the indexes from 0 to 6 of each slot
+_STARG = _slot_opcodes('STARG')
+_STLOC = _slot_opcodes('STLOC')
+_STSFLD = _slot_opcodes('STSFLD')
+_LDARG = _slot_opcodes('LDARG')
+_LDLOC = _slot_opcodes('LDLOC')
+_LDSFLD = _slot_opcodes('LDSFLD')
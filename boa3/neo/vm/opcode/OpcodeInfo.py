@@ -15,9 +15,7 @@ class OpcodeInfo:
         :return: The opcode info if it exists. None otherwise
         :rtype: OpcodeInformation or None
         """
-        for id, op in vars(cls).items():
-            if isinstance(op, OpcodeInformation) and op.opcode is opcode:
-                return op
+        return _INFO_BY_OPCODE.get(opcode)
 
     # region Constants
 
@@ -324,8 +322,8 @@ class OpcodeInfo:
 
     # region Splice
 
-    NEWBUFFER = OpcodeInformation(Opcode.NEWBUFFER),
-    MEMCPY = OpcodeInformation(Opcode.MEMCPY),
+    NEWBUFFER = OpcodeInformation(Opcode.NEWBUFFER)
+    MEMCPY = OpcodeInformation(Opcode.MEMCPY)
     # Concatenates two strings.
     CAT = OpcodeInformation(Opcode.CAT)
     # Returns a section of a string.
@@ -467,3 +465,7 @@ class OpcodeInfo:
     CONVERT = OpcodeInformation(Opcode.CONVERT, 1)
 
     # endregion
+
+
+# maps each opcode to its information, so get_info doesn't need to scan the class attributes
+_INFO_BY_OPCODE = {op.opcode: op for op in vars(OpcodeInfo).values() if isinstance(op, OpcodeInformation)}
@@ -21,7 +21,7 @@ class OpcodeInformation:
         self.max_data_len: int = min_data_len + extra_data_max_len
 
     def get_large(self):
-        large_op = self.opcode.get_large
+        large_op = self.opcode.get_large_jump()
         if large_op is None:
             return None
 
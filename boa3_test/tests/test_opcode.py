@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from boa3.neo.vm.opcode.Opcode import Opcode
+
+
+class TestOpcode(TestCase):
+
+    def test_small_jump(self):
+        self.assertTrue(Opcode.JMP.is_small_jump)
+        self.assertTrue(Opcode.JMPLE.is_small_jump)
+        self.assertFalse(Opcode.JMP_L.is_small_jump)
+        self.assertFalse(Opcode.CALL.is_small_jump)
+
+    def test_large_jump(self):
+        self.assertTrue(Opcode.JMP_L.is_large_jump)
+        self.assertTrue(Opcode.JMPLE_L.is_large_jump)
+        self.assertFalse(Opcode.JMP.is_large_jump)
+        self.assertFalse(Opcode.CALL_L.is_large_jump)
+
+    def test_literal_push(self):
+        self.assertIs(Opcode.PUSHM1, Opcode.get_literal_push(-1))
+        self.assertIs(Opcode.PUSH0, Opcode.get_literal_push(0))
+        self.assertIs(Opcode.PUSH7, Opcode.get_literal_push(7))
+        self.assertIs(Opcode.PUSH16, Opcode.get_literal_push(16))
+        self.assertIsNone(Opcode.get_literal_push(-2))
+        self.assertIsNone(Opcode.get_literal_push(17))
+
+    def test_store(self):
+        self.assertIs(Opcode.STLOC0, Opcode.get_store(0, local=True))
+        self.assertIs(Opcode.STLOC6, Opcode.get_store(6, local=True))
+        self.assertIs(Opcode.STLOC, Opcode.get_store(7, local=True))
+        self.assertIs(Opcode.STARG3, Opcode.get_store(3, local=True, is_arg=True))
+        self.assertIs(Opcode.STARG, Opcode.get_store(7, local=True, is_arg=True))
+        self.assertIs(Opcode.STSFLD2, Opcode.get_store(2, local=False, is_arg=True))
+        self.assertIs(Opcode.STSFLD, Opcode.get_store(10, local=False))
+
+    def test_load(self):
+        self.assertIs(Opcode.LDLOC0, Opcode.get_load(0, local=True))
+        self.assertIs(Opcode.LDLOC6, Opcode.get_load(6, local=True))
+        self.assertIs(Opcode.LDLOC, Opcode.get_load(7, local=True))
+        self.assertIs(Opcode.LDARG3, Opcode.get_load(3, local=True, is_arg=True))
+        self.assertIs(Opcode.LDARG, Opcode.get_load(7, local=True, is_arg=True))
+        self.assertIs(Opcode.LDSFLD2, Opcode.get_load(2, local=False, is_arg=True))
+        self.assertIs(Opcode.LDSFLD, Opcode.get_load(10, local=False))
+
+    def test_large_jump_of_small_jump(self):
+        self.assertIs(Opcode.JMP_L, Opcode.JMP.get_large_jump())
+        self.assertIs(Opcode.JMPIFNOT_L, Opcode.JMPIFNOT.get_large_jump())
+        self.assertIs(Opcode.JMPLE_L, Opcode.JMPLE.get_large_jump())
+        self.assertIs(Opcode.JMP_L, Opcode.JMP_L.get_large_jump())
+        self.assertIsNone(Opcode.CALL.get_large_jump())
+
+    def test_splice_opcodes(self):
+        self.assertEqual(b'\x88', Opcode.NEWBUFFER.value)
+        self.assertEqual(b'\x89', Opcode.MEMCPY.value)